@@ -11,6 +11,12 @@ import argparse
 from src.runner import run_app
 from src.logging import StderrToStdoutRedirector
 
+def positive_int(value: str) -> int:
+    number = int(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return number
+
 def main():
     # Redirect stderr to stdout using our smart wrapper that handles table prefixes
     sys.stderr = StderrToStdoutRedirector()
@@ -51,6 +57,7 @@ def main():
     parser.add_argument("--enable-step-3-and-4", action="store_true", help="Enable Steps 3 and 4 (Narrow Search and Extended Check) which are disabled by default.")
     parser.add_argument("--judge-consistency-enable", action="store_true", help="Enable the Consistency Judge in the advanced solution picker (Disabled by default).")
     parser.add_argument("--disable-judge-duo-pick", dest="judge_duo_pick", action="store_false", default=True, help="Disable the Duo Pick (Meta-Conclusion) Judge in the advanced solution picker (Enabled by default).")
+    parser.add_argument("--judge-reasoning-max-chars", type=positive_int, default=None, help="Trim each reasoning trace shown to the Logic/Consistency judges to this many characters, keeping its head and tail (Default: no trimming).")
     parser.add_argument("--logs-directory", type=str, default="logs/", help="Directory to save log files (default: logs/).")
     parser.add_argument("--submissions-directory", type=str, default="submissions/", help="Directory to save submission files (default: submissions/).")
     parser.add_argument("--answers-directory", type=str, help="Optional directory containing answer files (with 'output' for test cases).")
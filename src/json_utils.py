@@ -0,0 +1,13 @@
+"""
+JSON parsing shared across the application. Uses orjson (see requirements.txt) when it is
+installed and falls back to the standard library otherwise.
+
+src/sandbox_driver.py runs as a standalone script and keeps its own import.
+"""
+import json
+
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
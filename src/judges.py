@@ -1,8 +1,37 @@
+import hashlib
 import json
+import os
 import re
 import time
 import sys
+from pathlib import Path
 from src.models import call_model, calculate_cost, parse_model_arg
+from src.logging import get_logger
+from src.json_utils import json_loads
+
+logger = get_logger("judges")
+
+_FENCE = "```"
+
+# Per-line patterns used by extract_all_grids, compiled once
+_ROW_LABEL_RE = re.compile(r'^Row\s+\d+:?$', re.IGNORECASE)
+_NUMBERED_ITEM_RE = re.compile(r'^\d+[\.\)]\s+')
+_DIGIT_RE = re.compile(r'\d')
+
+def _fenced_object_blocks(text):
+    """Yields the bodies of ``` / ```json fenced blocks that look like a single JSON object."""
+    pos = text.find(_FENCE)
+    while pos != -1:
+        body_start = pos + len(_FENCE)
+        if text.startswith("json", body_start):
+            body_start += len("json")
+        close = text.find(_FENCE, body_start)
+        if close == -1:
+            return
+        body = text[body_start:close].strip()
+        if body.startswith("{") and body.endswith("}"):
+            yield body
+        pos = text.find(_FENCE, close + len(_FENCE))
 
 def extract_json(text):
     """
@@ -12,33 +41,80 @@ def extract_json(text):
     if not text:
         return None
     text = text.strip()
+
+    # Any qualifying object must contain the "candidates" key, so bail out early without it
+    last_key_idx = text.rfind('"candidates"')
+    if last_key_idx == -1:
+        return None
     
-    # 1. Try to find JSON block within markdown fences
-    match = re.search(r"```(?:json)?\s*(\{.*?\})\s*```", text, re.DOTALL)
-    if match:
+    # 1. Try to find JSON block within markdown fences (linear scan, no backtracking regex)
+    for body in _fenced_object_blocks(text):
         try:
-            obj = json.loads(match.group(1))
-            if isinstance(obj, dict) and "candidates" in obj:
-                return obj
-        except json.JSONDecodeError:
-            pass
+            obj = json_loads(body)
+        except ValueError:
+            continue
+        if isinstance(obj, dict) and "candidates" in obj:
+            return obj
 
-    # 2. Scan for any '{' and try to decode a valid JSON object
+    # 2. Scan for any '{' and try to decode a valid JSON object.
+    # Objects starting after the last "candidates" key cannot contain it, so stop there.
     decoder = json.JSONDecoder()
-    for match in re.finditer(r"\{", text):
-        start_idx = match.start()
+    start_idx = text.find("{")
+    while start_idx != -1 and start_idx < last_key_idx:
         try:
             # raw_decode parsing stops at the end of the valid object
             obj, _ = decoder.raw_decode(text, idx=start_idx)
             if isinstance(obj, dict) and "candidates" in obj:
                 return obj
         except json.JSONDecodeError:
-            continue
+            pass
+        start_idx = text.find("{", start_idx + 1)
             
     return None
 
+# Judge verdicts are cached on disk only when ARC_AGI_JUDGE_CACHE_DIR is set
+_JUDGE_CACHE_FIELDS = ("response", "parsed", "model", "requested_model", "actual_model")
+_DUO_CACHE_FIELDS = ("response", "model", "picked_grids")
+
+def _judge_cache_path(judge_model, prompt, variant=""):
+    """variant separates entries that share a prompt, e.g. the council's independent runs."""
+    cache_dir = os.getenv("ARC_AGI_JUDGE_CACHE_DIR")
+    if not cache_dir:
+        return None
+    digest = hashlib.sha256((variant + prompt).encode("utf-8")).hexdigest()
+    return Path(cache_dir) / judge_model / f"{digest}.json"
+
+def _load_cached_verdict(cache_path):
+    try:
+        with open(cache_path, "rb") as f:
+            return json_loads(f.read())
+    except (OSError, ValueError):
+        return None
+
+def _store_cached_verdict(cache_path, result_container, fields=_JUDGE_CACHE_FIELDS):
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        entry = {k: result_container.get(k) for k in fields}
+        # Write to a private temp file and rename, so concurrent judges never see a partial entry
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.{time.monotonic_ns()}.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(entry, f)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.warning(f"[pick_solution_v2] Could not write judge cache entry {cache_path}: {e}")
+
 def run_judge(judge_name, prompt, judge_model, openai_client, anthropic_client, google_keys, result_container, verbose: int = 0, use_background: bool = False):
     timings = []
+    cache_path = _judge_cache_path(judge_model, prompt)
+    if cache_path is not None:
+        cached = _load_cached_verdict(cache_path)
+        if cached and cached.get("parsed"):
+            result_container.update(cached)
+            result_container["cache_hit"] = True
+            if verbose >= 1:
+                print(f"[pick_solution_v2] {judge_name} Judge: using cached verdict {cache_path.name}")
+            return cached["parsed"]
+
     try:
         start_ts = time.perf_counter()
         response_obj = call_model(openai_client, anthropic_client, google_keys, prompt, judge_model, use_background=use_background, timing_tracker=timings)
@@ -73,12 +149,18 @@ def run_judge(judge_name, prompt, judge_model, openai_client, anthropic_client,
         
         if parsed_json:
             result_container["parsed"] = parsed_json
+            if cache_path is not None:
+                _store_cached_verdict(cache_path, result_container)
             return parsed_json
         else:
-            print(f"[pick_solution_v2] {judge_name} Judge: Could not parse JSON. Response start: {response_obj.text[:500]}")
+            # The full response is already kept in result_container; only echo an excerpt when verbose
+            if verbose >= 1:
+                logger.warning(f"[pick_solution_v2] {judge_name} Judge: Could not parse JSON. Response start: {response_obj.text[:500]}")
+            else:
+                logger.warning(f"[pick_solution_v2] {judge_name} Judge: Could not parse JSON.")
             
     except Exception as e:
-        print(f"[pick_solution_v2] {judge_name} Judge Error: {e}")
+        logger.error(f"[pick_solution_v2] {judge_name} Judge Error: {e}")
         result_container["error"] = str(e)
     return None
 
@@ -105,7 +187,7 @@ def extract_all_grids(text):
         if not stripped:
             candidate_rows.append(None)
             continue
-        if re.match(r'^Row\s+\d+:?$', stripped, re.IGNORECASE):
+        if _ROW_LABEL_RE.match(stripped):
             candidate_rows.append(None)
             continue
         if stripped.startswith(("-", "*", "+")):
@@ -115,7 +197,7 @@ def extract_all_grids(text):
         row = None
         try:
             clean_line = stripped.replace("`", " ").replace("[", " ").replace("]", " ").strip()
-            numbered_list_match = re.match(r'^\d+[\.\)]\s+', clean_line)
+            numbered_list_match = _NUMBERED_ITEM_RE.match(clean_line)
             if numbered_list_match:
                 clean_line = clean_line[numbered_list_match.end():]
 
@@ -125,7 +207,7 @@ def extract_all_grids(text):
             else:
                 if ":" in clean_line:
                     clean_line = clean_line.split(":")[-1].strip()
-                match = re.search(r'\d', clean_line)
+                match = _DIGIT_RE.search(clean_line)
                 if match:
                     last_digit_idx = -1
                     for idx, char in enumerate(clean_line):
@@ -170,6 +252,17 @@ def extract_all_grids(text):
 
 def run_duo_pick_judge(prompt, judge_model, openai_client, anthropic_client, google_keys, result_container, verbose: int = 0, use_background: bool = False):
     timings = []
+    run_index = result_container.get("run_index", 0)
+    cache_path = _judge_cache_path(judge_model, prompt, variant=f"duo_pick:{run_index}\n")
+    if cache_path is not None:
+        cached = _load_cached_verdict(cache_path)
+        if cached and cached.get("picked_grids"):
+            result_container.update(cached)
+            result_container["cache_hit"] = True
+            if verbose >= 1:
+                print(f"[pick_solution_v2] Duo Pick Judge {run_index}: using cached picks {cache_path.name}")
+            return cached["picked_grids"]
+
     try:
         start_ts = time.perf_counter()
         response_obj = call_model(openai_client, anthropic_client, google_keys, prompt, judge_model, use_background=use_background, timing_tracker=timings)
@@ -201,15 +294,15 @@ def run_duo_pick_judge(prompt, judge_model, openai_client, anthropic_client, goo
             if g not in unique_grids:
                 unique_grids.append(g)
         
-        if len(unique_grids) >= 2:
-            # Take the last two distinct grids
-            result_container["picked_grids"] = unique_grids[-2:]
-            return unique_grids[-2:]
-        elif len(unique_grids) == 1:
-            result_container["picked_grids"] = unique_grids
-            return unique_grids
+        # Take the last two distinct grids
+        picked_grids = unique_grids[-2:]
+        if picked_grids:
+            result_container["picked_grids"] = picked_grids
+            if cache_path is not None:
+                _store_cached_verdict(cache_path, result_container, _DUO_CACHE_FIELDS)
+            return picked_grids
             
     except Exception as e:
-        print(f"[pick_solution_v2] Duo Pick Judge Error: {e}")
+        logger.error(f"[pick_solution_v2] Duo Pick Judge Error: {e}")
         result_container["error"] = str(e)
     return None
\ No newline at end of file
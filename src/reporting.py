@@ -1,6 +1,8 @@
-import datetime
+import functools
 import json
+import re
 import sys
+import time
 from pathlib import Path
 from typing import List
 
@@ -9,16 +11,22 @@ from src.logging import get_logger
 
 logger = get_logger("reporting")
 
+# Casing fixups applied after title-casing; add entries here rather than chaining str.replace.
+_NAME_FIXUPS = {"Gpt": "GPT"}
+_NAME_FIXUPS_RE = re.compile("|".join(re.escape(k) for k in _NAME_FIXUPS))
+_TITLE_RE = re.compile(r"(^|-)([a-z])")
+
 # Re-implement get_column_name locally or import if shared. 
 # Since it's presentation logic, it fits here.
+@functools.lru_cache(maxsize=None)
 def get_column_name(model_arg: str) -> str:
-    parts = model_arg.split("-")
-    formatted_parts = [p.title() if not p[0].isdigit() else p for p in parts]
-    name = "-".join(formatted_parts)
-    name = name.replace("Gpt", "GPT")
-    return name
+    # Title-case each dash-separated part in one regex pass (parts starting with a digit are untouched)
+    name = _TITLE_RE.sub(lambda m: m.group(1) + m.group(2).upper(), model_arg)
+    return _NAME_FIXUPS_RE.sub(lambda m: _NAME_FIXUPS[m.group(0)], name)
 
 TABLE_COLUMNS = [get_column_name(m) for m in ORDERED_MODELS]
+# TABLE_COLUMNS is derived from ORDERED_MODELS, so a model's column slot is its position there.
+_MODEL_ARG_TO_INDEX = {model_arg: i for i, model_arg in enumerate(ORDERED_MODELS)}
 
 def print_table_header() -> None:
     # Add Duration and Cost to header
@@ -27,25 +35,21 @@ def print_table_header() -> None:
     print("| " + " | ".join(["---"] * len(columns)) + " |")
 
 def print_result_row(row_idx: int, result: TaskResult) -> None:
-    column_key = get_column_name(result.model_arg)
+    column_index = _MODEL_ARG_TO_INDEX[result.model_arg]
 
     # Redundant validation removed. 
-    # column_key validity is implicitly guaranteed by SUPPORTED_MODELS check in config parsing
+    # column_index validity is implicitly guaranteed by SUPPORTED_MODELS check in config parsing
     # and the fact that TABLE_COLUMNS is derived from ORDERED_MODELS.
 
-    values = {column: "-" for column in TABLE_COLUMNS}
-    values[column_key] = "PASS" if result.success else "FAIL"
-    
-    verified_str = "-"
-    if result.verified is not None:
-        verified_str = "PASS" if result.verified else "FAIL"
+    verified = result.verified
+    verified_str = "-" if verified is None else ("PASS" if verified else "FAIL")
 
-    row = (
-        [str(row_idx), str(result.task_path), str(result.test_index)]
-        + [values[col] for col in TABLE_COLUMNS]
-        + [f"{result.duration:.2f}", f"{result.cost:.2f}", verified_str]
-    )
-    print("| " + " | ".join(row) + " |")
+    # One preallocated slot list: [prefix, *model cells, suffix], joined once.
+    row = ["-"] * (len(TABLE_COLUMNS) + 2)
+    row[0] = f"| {row_idx} | {result.task_path} | {result.test_index}"
+    row[1 + column_index] = "PASS" if result.success else "FAIL"
+    row[-1] = f"{result.duration:.2f} | {result.cost:.2f} | {verified_str} |"
+    print(" | ".join(row))
 
 def print_summary(all_results: List[TaskResult]) -> None:
     total = len(all_results)
@@ -55,26 +59,35 @@ def print_summary(all_results: List[TaskResult]) -> None:
         print("---------------")
         return
 
-    passed = sum(1 for r in all_results if r.success)
-    percent_pass = (passed / total) * 100 if total > 0 else 0.0
+    # Single pass over the results for every aggregate below.
+    passed = 0
+    verified_passed = 0
+    total_time = 0.0
+    total_cost = 0.0
+    # Count cases where Verified=PASS but Result=FAIL
+    verified_but_failed_list = []
+    verified_but_failed_results = []
+    for r in all_results:
+        if r.success:
+            passed += 1
+        if r.verified:
+            verified_passed += 1
+            if not r.success:
+                verified_but_failed_list.append(r.task_path.stem)
+                verified_but_failed_results.append(r)
+        total_time += r.duration
+        total_cost += r.cost
 
-    verified_passed = sum(1 for r in all_results if r.verified)
+    percent_pass = (passed / total) * 100 if total > 0 else 0.0
     percent_verified = (verified_passed / total) * 100 if total > 0 else 0.0
 
-    # Count cases where Verified=PASS but Result=FAIL
-    verified_but_failed_list = [
-        str(r.task_path.stem) for r in all_results if r.verified and not r.success
-    ]
     verified_but_failed_count = len(verified_but_failed_list)
     verified_but_failed_str = str(verified_but_failed_count)
     if verified_but_failed_count > 0:
         ids_str = ", ".join(verified_but_failed_list)
         verified_but_failed_str += f" ({ids_str})"
 
-    total_time = sum(r.duration for r in all_results)
     avg_time = total_time / total if total > 0 else 0.0
-
-    total_cost = sum(r.cost for r in all_results)
     avg_cost = total_cost / total if total > 0 else 0.0
 
     print("\n--- Summary ---")
@@ -88,10 +101,9 @@ def print_summary(all_results: List[TaskResult]) -> None:
 
     if verified_but_failed_count > 0:
         print("\n--- Verified but Failed Strategies ---")
-        for r in all_results:
-            if r.verified and not r.success:
-                print(f"\nTask: {r.task_path.name} (Test {r.test_index})")
-                print(f"Strategy:\n{r.strategy}")
+        for r in verified_but_failed_results:
+            print(f"\nTask: {r.task_path.name} (Test {r.test_index})")
+            print(f"Strategy:\n{r.strategy}")
         print("--------------------------------------")
 
 def save_json_log(
@@ -102,7 +114,7 @@ def save_json_log(
     log_dir = Path("logs")
     log_dir.mkdir(exist_ok=True)
 
-    timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+    timestamp = time.strftime("%Y%m%d_%H%M%S", time.localtime())
     # Removed hardcoded _csv_ as requested
     log_filename = f"{timestamp}_{model_arg}_{dataset_name}.json"
     log_path = log_dir / log_filename
@@ -123,10 +135,11 @@ def save_json_log(
         
         log_data.append(log_entry)
 
-    log_path.write_text(json.dumps(log_data, indent=2))
+    with open(log_path, "w") as f:
+        json.dump(log_data, f, indent=2)
     # This is a user-facing message, so print() is acceptable, 
     # but logging.info is also fine. Let's stick to print for output consistency.
     print(f"Log saved to: {log_path}")
 
 def print_solver_summary(duration: float, total_cost: float, outcome: str) -> None:
-    print(f"{outcome} (${total_cost:.4f})")
\ No newline at end of file
+    sys.stdout.write(f"{outcome} (${total_cost:.4f})\n")
\ No newline at end of file
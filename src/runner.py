@@ -53,6 +53,7 @@ def run_app(
     enable_step_3_and_4=False,
     judge_consistency_enable=False,
     judge_duo_pick=True,
+    judge_reasoning_max_chars=None,
 ):
     # Set default values based on mode if not provided
     if step1_models is None:
@@ -103,7 +104,8 @@ def run_app(
         openai_background=openai_background,
         enable_step_3_and_4=enable_step_3_and_4,
         judge_consistency_enable=judge_consistency_enable,
-        judge_duo_pick=judge_duo_pick
+        judge_duo_pick=judge_duo_pick,
+        judge_reasoning_max_chars=judge_reasoning_max_chars
     )
     print("THIS IS THE OLD VERSION, USE THE V7 BRANCH")
     return
@@ -1,264 +1,236 @@
 import os
 import sys
 import json
+import atexit
+import select
 import signal
+import struct
 import subprocess
-import tempfile
+import threading
 import time
-import traceback
 import numpy as np
 from typing import Any, Tuple
 
-# This driver script runs INSIDE the subprocess
-_SANDBOX_DRIVER = r"""
-import json
-import sys
-import traceback
-import math
-import itertools
-from collections import Counter, deque, defaultdict
-from typing import List, Optional, Tuple, Any, Dict, Set
-import copy
-
-# Attempt to import common libs
-try:
-    import numpy as np
-except ImportError:
-    np = None
-
-try:
-    import scipy
-    import scipy.ndimage
-except ImportError:
-    scipy = None
-
-try:
-    import cv2
-except ImportError:
-    cv2 = None
-
-def convert_to_numpy(obj):
-    if np is None: return obj
-    if isinstance(obj, list):
-        return np.array(obj)
-    return obj
-
-def sanitize_output(obj):
-    if isinstance(obj, list):
-        return [sanitize_output(x) for x in obj]
-    if isinstance(obj, tuple):
-        return tuple(sanitize_output(x) for x in obj)
-    if isinstance(obj, dict):
-        return {k: sanitize_output(v) for k, v in obj.items()}
-    if np and isinstance(obj, (np.integer, int)):
-        return int(obj)
-    if np and isinstance(obj, (np.floating, float)):
-        return float(obj)
-    if np and isinstance(obj, np.ndarray):
-        return sanitize_output(obj.tolist())
-    return obj
-
-def secure_runtime():
-    import sys
-    import os
-
-    # --- Layer 1: Socket Monkey Patching (Patch FIRST) ---
-    # We import and cripple the socket module immediately. 
-    # Even if Layer 2 (Poisoning) is bypassed or undone, the cached module object 
-    # remains broken ("booby-trapped").
-    try:
-        import socket
-        def blocked_op(*args, **kwargs):
-            raise RuntimeError("Sandbox Violation: Network operation blocked by monkey-patch.")
-        
-        socket.socket = blocked_op
-        socket.create_connection = blocked_op
-        socket.getaddrinfo = blocked_op
-        socket.gethostbyname = blocked_op
-    except (ImportError, AttributeError, TypeError):
-        pass 
-
-    # --- Layer 2: Network Poisoning (Poison SECOND) ---
-    # Disable specific libraries by injecting None into sys.modules.
-    # This prevents them from being imported in the first place.
-    banned_modules = [
-        # Fundamentals
-        'socket', 'ssl', 'asyncio',
-        
-        # Standard Library Clients
-        'requests', 'urllib3', 'ftplib', 'poplib', 'imaplib', 'nntplib', 'smtplib', 'telnetlib', 
-        
-        # Modern Async & WebSockets
-        'httpx', 'aiohttp', 'websockets',
-        
-        # SSH / Cloud / System
-        'paramiko', 'boto3', 'botocore', 'google', 'azure', 'subprocess'
-    ]
-    
-    for mod in banned_modules:
-        sys.modules[mod] = None
-
-    # --- Layer 3: Audit Hooks ---
-    # The final line of defense for events that might bypass python layers.
-    def audit_hook(event, args):
-        # 1. Block Low-Level Network Access
-        if event in ["socket.bind", "socket.connect", "http.client.connect", "urllib.request"]:
-            raise RuntimeError(f"Sandbox Violation: Network attempt detected ({event})")
-        
-        # 2. Block Subprocesses
-        if event in ["os.system", "subprocess.Popen", "os.posix_spawn"]:
-            raise RuntimeError("Sandbox Violation: Subprocess detected")
-
-    if hasattr(sys, 'addaudithook'):
-        sys.addaudithook(audit_hook)
-
-def main():
+# The driver (src/sandbox_driver.py) runs as the sandbox worker process
+_DRIVER_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sandbox_driver.py")
+
+# Must match the framing in src/sandbox_driver.py: 4-byte little-endian length, then the body
+_FRAME_HEADER = struct.Struct("<I")
+
+# Executions time themselves out inside the worker; the parent only kills the worker if
+# no reply arrives this long after the budget (e.g. the solver blocked SIGALRM)
+_TIMEOUT_GRACE_S = 1.0
+
+# Each idle worker holds ~90 MB, and every task process has its own pool: cap the workers
+# per process (extra callers wait for one) and shut down workers left idle this long.
+# The default matches the widest caller fan-out, the 30 codegen threads of step 5
+# (src/solver/steps.py), so executions run as concurrently as with one process per call;
+# time spent waiting for a worker is not counted against the execution's timeout.
+_MAX_WORKERS = int(os.getenv("ARC_AGI_SANDBOX_WORKERS", "30"))
+_IDLE_TIMEOUT_S = 30.0
+
+def _parse_reply(stdout_data: bytes, stderr_data: str) -> Tuple[bool, Any, str]:
+    if not stdout_data.strip():
+        return False, "Empty output from subprocess", stderr_data
+
     try:
-        # Secure the runtime environment immediately
-        secure_runtime()
-
-        # Read payload from stdin
-        input_data = sys.stdin.read()
-        if not input_data:
-            raise ValueError("No input received on stdin")
-            
-        payload = json.loads(input_data)
-        code = payload["code"]
-        inp_raw = payload["input"]
-        
-        # Convert input list to numpy array if available
-        inp = convert_to_numpy(inp_raw)
-
-        # Build execution scope
-        local_scope = {
-            "np": np,
-            "cv2": cv2,
-            "scipy": scipy,
-            "Counter": Counter,
-            "deque": deque,
-            "defaultdict": defaultdict,
-            "List": List,
-            "Optional": Optional,
-            "Tuple": Tuple,
-            "Any": Any,
-            "Dict": Dict,
-            "Set": Set,
-            "copy": copy.copy,
-            "deepcopy": copy.deepcopy,
-            "gcd": math.gcd,
-            "math": math,
-            "itertools": itertools,
-            "Grid": List[List[int]]
-        }
-
-        # Execute the definition
-        exec(code, local_scope)
-        
-        if "solver" not in local_scope:
-            raise RuntimeError("No 'solver' function defined in code.")
-
-        solver = local_scope["solver"]
-        if not callable(solver):
-            raise RuntimeError("'solver' is not callable.")
-
-        # Run the solver
-        raw_out = solver(inp)
-        
-        # Serialize output
-        out = sanitize_output(raw_out)
-
-        json.dump({"ok": True, "output": out}, sys.stdout)
-        
-    except Exception as e:
-        # Print error details to stdout as JSON
-        json.dump(
-            {
-                "ok": False, 
-                "error": f"{type(e).__name__}: {str(e)}", 
-                "traceback": traceback.format_exc()
-            },
-            sys.stdout
-        )
-        # Also print to stderr for debugging logs
-        print(f"Sandbox Error: {e}", file=sys.stderr)
-        traceback.print_exc(file=sys.stderr)
+        result = json.loads(stdout_data)
+    except ValueError:
+        stdout_text = stdout_data.decode(errors="replace")
+        return False, "Invalid JSON output from subprocess", f"Stdout: {stdout_text}\nStderr: {stderr_data}"
 
-if __name__ == "__main__":
-    main()
-"""
+    if result.get("ok"):
+        return True, result["output"], stderr_data
+    else:
+        return False, result.get("error", "Unknown error"), result.get("traceback", stderr_data)
 
-def _preexec_new_pgrp():
-    """
-    Sets the process group ID to the PID of the new process.
-    This allows killing the entire process group later.
-    """
-    os.setsid()
+class WorkerLost(Exception):
+    """The worker died before sending any reply frame, so the payload can be retried elsewhere."""
 
-def run_untrusted_code(code: str, input_data: Any, timeout_s: float = 10.0) -> Tuple[bool, Any, str]:
+class SandboxWorker:
     """
-    Runs untrusted code in a separate subprocess.
-    Returns: (success, result_or_error, logs)
-    
-    success: bool
-    result_or_error: result data if success, else error message
-    logs: captured stderr
+    One long-lived driver process. Starting an interpreter and importing numpy/scipy/cv2 costs
+    ~0.35s, so it is paid once per worker; the worker forks a fresh child per execution.
     """
-    
-    # Convert numpy inputs to list for JSON serialization
-    if isinstance(input_data, np.ndarray):
-        input_data = input_data.tolist()
-        
-    payload = {"code": code, "input": input_data}
-    
-    # Create a temporary file for the driver
-    # We use a temp file instead of passing code via -c to avoid shell escaping hell
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False, encoding='utf-8') as driver_file:
-        driver_file.write(_SANDBOX_DRIVER)
-        driver_path = driver_file.name
 
-    try:
-        p = subprocess.Popen(
-            [sys.executable, "-u", driver_path],
+    def __init__(self):
+        self.proc = subprocess.Popen(
+            # -P: don't put src/ on sys.path, its logging.py / types.py would shadow the stdlib
+            [sys.executable, "-P", _DRIVER_PATH],
             stdin=subprocess.PIPE,
             stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            preexec_fn=_preexec_new_pgrp, # Unix only, crucial for killpg
+            bufsize=0,
+            start_new_session=True, # Own process group, crucial for killpg
         )
 
+    def execute(self, payload: dict, timeout_s: float) -> Tuple[dict, bytes]:
+        """
+        Sends one payload and waits for the two reply frames: the execution's logs and
+        exit code, then its raw JSON reply. Raises TimeoutError if they don't arrive within timeout_s.
+        """
+        deadline = time.monotonic() + timeout_s
+        body = json.dumps(payload).encode()
         try:
-            stdout_data, stderr_data = p.communicate(input=json.dumps(payload), timeout=timeout_s)
-        except subprocess.TimeoutExpired:
-            # Kill the process group
+            self.proc.stdin.write(_FRAME_HEADER.pack(len(body)) + body)
+            logs = json.loads(self._read_frame(deadline))
+        except (BrokenPipeError, EOFError) as e:
+            raise WorkerLost(str(e)) from e
+        return logs, self._read_frame(deadline)
+
+    def _read_frame(self, deadline: float) -> bytes:
+        (size,) = _FRAME_HEADER.unpack(self._read_exact(_FRAME_HEADER.size, deadline))
+        return self._read_exact(size, deadline)
+
+    def _read_exact(self, n: int, deadline: float) -> bytes:
+        fd = self.proc.stdout.fileno()
+        chunks = []
+        while n > 0:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not select.select([fd], [], [], remaining)[0]:
+                raise TimeoutError
+            chunk = os.read(fd, n)
+            if not chunk:
+                raise EOFError(f"Sandbox worker exited (Exit Code: {self.proc.poll()})")
+            chunks.append(chunk)
+            n -= len(chunk)
+        return b"".join(chunks)
+
+    def kill(self):
+        # Kills the worker and the execution it forked (they share the process group)
+        try:
+            os.killpg(self.proc.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass # Already dead
+        self.proc.wait()
+        self.close_pipes()
+
+    def close_pipes(self):
+        self.proc.stdin.close()
+        self.proc.stdout.close()
+
+class SandboxPool:
+    """
+    Idle workers are checked out per call and returned afterwards. At most max_workers exist
+    at once (further callers wait for a free one); a worker is replaced after a timeout or
+    failure, and shut down once it has been idle for idle_timeout_s.
+    """
+
+    def __init__(self, max_workers: int = _MAX_WORKERS, idle_timeout_s: float = _IDLE_TIMEOUT_S):
+        self.max_workers = max(1, max_workers)
+        self.idle_timeout_s = idle_timeout_s
+        self._reset()
+
+    def _reset(self):
+        self._cond = threading.Condition()
+        self._idle = [] # (worker, idle since), most recently returned last
+        self._workers = set() # every live worker, idle or checked out
+        self._reaper = None
+
+    def run(self, payload: dict, timeout_s: float) -> Tuple[bool, Any, str]:
+        for attempt in range(2):
+            worker = self._checkout()
             try:
-                os.killpg(os.getpgid(p.pid), signal.SIGKILL)
-            except ProcessLookupError:
-                pass # Already dead
-            
+                logs, reply = worker.execute(payload, timeout_s + _TIMEOUT_GRACE_S)
+            except TimeoutError:
+                self._discard(worker)
+                return False, "TIMEOUT_EXPIRED", f"Execution timed out after {timeout_s}s"
+            except WorkerLost:
+                # e.g. killed between checkout and the request: retry once on another worker
+                self._discard(worker)
+                if attempt == 0:
+                    continue
+                raise
+            except BaseException:
+                self._discard(worker)
+                raise
+            self._checkin(worker)
+            break
+
+        if logs["exit_code"] == -signal.SIGALRM:
             return False, "TIMEOUT_EXPIRED", f"Execution timed out after {timeout_s}s"
+        if logs["exit_code"] != 0:
+            # Crashed without JSON output (e.g., segfault or sys.exit in the solver)
+            return False, f"Subprocess crashed (Exit Code: {logs['exit_code']})", logs["stderr"]
+
+        # Anything the solver printed precedes the reply and makes it unparseable, as it
+        # did when both shared the driver's stdout
+        printed = logs["stdout"]
+        return _parse_reply(printed.encode() + reply if printed else reply, logs["stderr"])
+
+    def _checkout(self) -> SandboxWorker:
+        with self._cond:
+            while True:
+                while not self._idle and len(self._workers) >= self.max_workers:
+                    self._cond.wait()
+                if not self._idle:
+                    break
+                worker = self._idle.pop()[0]
+                if worker.proc.poll() is None:
+                    return worker
+                # Died while idle (OOM killer, external signal): drop it and look again
+                worker.close_pipes()
+                self._workers.discard(worker)
+            worker = SandboxWorker()
+            self._workers.add(worker)
+            if self._reaper is None:
+                self._reaper = threading.Thread(target=self._reap_loop, name="sandbox-reaper", daemon=True)
+                self._reaper.start()
+            return worker
+
+    def _checkin(self, worker: SandboxWorker):
+        with self._cond:
+            self._idle.append((worker, time.monotonic()))
+            self._cond.notify()
+
+    def _discard(self, worker: SandboxWorker):
+        worker.kill()
+        with self._cond:
+            self._workers.discard(worker)
+            self._cond.notify()
+
+    def _reap_loop(self):
+        while True:
+            time.sleep(self.idle_timeout_s / 2)
+            self.reap_idle(self.idle_timeout_s)
+
+    def reap_idle(self, min_idle_s: float = 0.0):
+        """Shuts down the workers that have been idle for at least min_idle_s."""
+        cutoff = time.monotonic() - min_idle_s
+        with self._cond:
+            expired = [w for w, since in self._idle if since <= cutoff]
+            self._idle = [(w, since) for w, since in self._idle if since > cutoff]
+            self._workers.difference_update(expired)
+            self._cond.notify_all()
+        for worker in expired:
+            worker.kill()
+
+    def _forget_workers(self):
+        # A forked copy of this process must not use (or keep open) the parent's worker pipes
+        for worker in self._workers:
+            worker.close_pipes()
+        self._reset()
+
+_POOL = SandboxPool()
+os.register_at_fork(after_in_child=_POOL._forget_workers)
+atexit.register(_POOL.reap_idle)
 
-        if p.returncode != 0:
-            # Crashed without JSON output (e.g., segfault or syntax error in driver)
-            return False, f"Subprocess crashed (Exit Code: {p.returncode})", stderr_data
+def run_untrusted_code(code: str, input_data: Any, timeout_s: float = 10.0) -> Tuple[bool, Any, str]:
+    """
+    Runs untrusted code in a separate process.
+    Returns: (success, result_or_error, logs)
 
-        if not stdout_data.strip():
-             return False, "Empty output from subprocess", stderr_data
+    success: bool
+    result_or_error: result data if success, else error message
+    logs: captured stderr
+    """
 
-        try:
-            result = json.loads(stdout_data)
-        except json.JSONDecodeError:
-             return False, "Invalid JSON output from subprocess", f"Stdout: {stdout_data}\nStderr: {stderr_data}"
+    # Convert numpy inputs to list for JSON serialization
+    if isinstance(input_data, np.ndarray):
+        input_data = input_data.tolist()
 
-        if result.get("ok"):
-            return True, result["output"], stderr_data
-        else:
-            return False, result.get("error", "Unknown error"), result.get("traceback", stderr_data)
+    payload = {"code": code, "input": input_data, "timeout_s": timeout_s}
 
+    try:
+        return _POOL.run(payload, timeout_s)
     except Exception as e:
         return False, f"System Error in Sandbox: {e}", str(e)
-    finally:
-        if os.path.exists(driver_path):
-            try:
-                os.remove(driver_path)
-            except OSError:
-                pass
@@ -0,0 +1,306 @@
+"""
+Runs untrusted solver code. This file executes as a long-lived sandbox worker process
+(see SandboxPool in src/sandbox.py), never inside the application.
+
+The worker imports numpy/scipy/cv2 once, then loops: it reads a length-prefixed JSON payload
+from stdin, forks a fresh child that runs the solver, and writes the child's result back as
+two length-prefixed frames (logs + exit code, then the JSON reply). Solvers never share an
+interpreter with each other.
+
+It imports nothing from `src`, so it runs as a plain script.
+"""
+import functools
+import io
+import json
+import os
+import signal
+import struct
+import sys
+import traceback
+import math
+import itertools
+from collections import Counter, deque, defaultdict
+from typing import List, Optional, Tuple, Any, Dict, Set
+import copy
+
+# Attempt to import common libs
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import scipy
+    import scipy.ndimage
+except ImportError:
+    scipy = None
+
+try:
+    import cv2
+except ImportError:
+    cv2 = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _json_dumps(obj) -> bytes:
+    return json.dumps(obj).encode()
+
+def _output_reply(raw_out) -> bytes:
+    # Integer arrays (the usual solver result) are written by orjson in C. They can't hold
+    # the values orjson encodes differently from json (NaN, ints beyond 64 bits), and the
+    # application decodes every reply with json. Everything else keeps the sanitize_output
+    # conversions, e.g. bools become 0/1.
+    if orjson is not None and np is not None and isinstance(raw_out, np.ndarray) and raw_out.dtype.kind in "iu":
+        try:
+            return orjson.dumps({"ok": True, "output": raw_out}, option=orjson.OPT_SERIALIZE_NUMPY)
+        except TypeError:
+            pass # e.g. non-contiguous arrays
+    return _json_dumps({"ok": True, "output": sanitize_output(raw_out)})
+
+def convert_to_numpy(obj):
+    if np is None: return obj
+    if isinstance(obj, list):
+        return np.array(obj)
+    return obj
+
+def sanitize_output(obj):
+    if isinstance(obj, list):
+        # Rows of plain ints (the usual list-based grid) need no per-cell conversion
+        if all(type(x) is int for x in obj):
+            return list(obj)
+        return [sanitize_output(x) for x in obj]
+    if isinstance(obj, tuple):
+        return tuple(sanitize_output(x) for x in obj)
+    if isinstance(obj, dict):
+        return {k: sanitize_output(v) for k, v in obj.items()}
+    if np and isinstance(obj, (np.integer, int)):
+        return int(obj)
+    if np and isinstance(obj, (np.floating, float)):
+        return float(obj)
+    if np and isinstance(obj, np.ndarray):
+        # tolist() already yields plain ints/floats for numeric arrays; bools become 0/1 as above
+        if obj.dtype.kind in "iuf":
+            return obj.tolist()
+        if obj.dtype.kind == "b":
+            return obj.astype(np.int64).tolist()
+        return sanitize_output(obj.tolist())
+    return obj
+
+def secure_runtime():
+    # --- Layer 1: Socket Monkey Patching (Patch FIRST) ---
+    # We import and cripple the socket module immediately.
+    # Even if Layer 2 (Poisoning) is bypassed or undone, the cached module object
+    # remains broken ("booby-trapped").
+    try:
+        import socket
+        def blocked_op(*args, **kwargs):
+            raise RuntimeError("Sandbox Violation: Network operation blocked by monkey-patch.")
+
+        socket.socket = blocked_op
+        socket.create_connection = blocked_op
+        socket.getaddrinfo = blocked_op
+        socket.gethostbyname = blocked_op
+    except (ImportError, AttributeError, TypeError):
+        pass
+
+    # --- Layer 2: Network Poisoning (Poison SECOND) ---
+    # Disable specific libraries by injecting None into sys.modules.
+    # This prevents them from being imported in the first place.
+    banned_modules = [
+        # Fundamentals
+        'socket', 'ssl', 'asyncio',
+
+        # Standard Library Clients
+        'requests', 'urllib3', 'ftplib', 'poplib', 'imaplib', 'nntplib', 'smtplib', 'telnetlib',
+
+        # Modern Async & WebSockets
+        'httpx', 'aiohttp', 'websockets',
+
+        # SSH / Cloud / System
+        'paramiko', 'boto3', 'botocore', 'google', 'azure', 'subprocess'
+    ]
+
+    for mod in banned_modules:
+        sys.modules[mod] = None
+
+    # --- Layer 3: Audit Hooks ---
+    # The final line of defense for events that might bypass python layers.
+    def audit_hook(event, args):
+        # 1. Block Low-Level Network Access
+        if event in ["socket.bind", "socket.connect", "http.client.connect", "urllib.request"]:
+            raise RuntimeError(f"Sandbox Violation: Network attempt detected ({event})")
+
+        # 2. Block Subprocesses
+        if event in ["os.system", "subprocess.Popen", "os.posix_spawn"]:
+            raise RuntimeError("Sandbox Violation: Subprocess detected")
+
+    if hasattr(sys, 'addaudithook'):
+        sys.addaudithook(audit_hook)
+
+@functools.lru_cache(maxsize=256)
+def compile_solver(code: str):
+    # A candidate is run once per train/test input, usually on the same worker; parse it once
+    return compile(code, "<string>", "exec")
+
+def run_payload(payload, code_obj=None) -> bytes:
+    """
+    Executes payload["code"] (or its precompiled code_obj), calls its solver on payload["input"]
+    and returns the JSON reply: {"ok": true, "output": ...} or {"ok": false, "error": ..., "traceback": ...}.
+    """
+    try:
+        # Secure the runtime environment immediately
+        secure_runtime()
+
+        code = payload["code"]
+        inp_raw = payload["input"]
+
+        # Convert input list to numpy array if available
+        inp = convert_to_numpy(inp_raw)
+
+        # Build execution scope
+        local_scope = {
+            "np": np,
+            "cv2": cv2,
+            "scipy": scipy,
+            "Counter": Counter,
+            "deque": deque,
+            "defaultdict": defaultdict,
+            "List": List,
+            "Optional": Optional,
+            "Tuple": Tuple,
+            "Any": Any,
+            "Dict": Dict,
+            "Set": Set,
+            "copy": copy.copy,
+            "deepcopy": copy.deepcopy,
+            "gcd": math.gcd,
+            "math": math,
+            "itertools": itertools,
+            "Grid": List[List[int]]
+        }
+
+        # Execute the definition
+        exec(code if code_obj is None else code_obj, local_scope)
+
+        if "solver" not in local_scope:
+            raise RuntimeError("No 'solver' function defined in code.")
+
+        solver = local_scope["solver"]
+        if not callable(solver):
+            raise RuntimeError("'solver' is not callable.")
+
+        # Run the solver
+        raw_out = solver(inp)
+
+        # Serialize output
+        return _output_reply(raw_out)
+
+    except Exception as e:
+        # Also print to stderr for debugging logs
+        print(f"Sandbox Error: {e}", file=sys.stderr)
+        traceback.print_exc(file=sys.stderr)
+        return _json_dumps(
+            {
+                "ok": False,
+                "error": f"{type(e).__name__}: {str(e)}",
+                "traceback": traceback.format_exc()
+            }
+        )
+
+# 4-byte little-endian length, then the body
+_FRAME_HEADER = struct.Struct("<I")
+
+def _read_frame(stream):
+    header = stream.read(_FRAME_HEADER.size)
+    if len(header) < _FRAME_HEADER.size:
+        return None
+    (size,) = _FRAME_HEADER.unpack(header)
+    return stream.read(size)
+
+def _write_frame(stream, data: bytes):
+    stream.write(_FRAME_HEADER.pack(len(data)) + data)
+    stream.flush()
+
+def _exit_code(exc: SystemExit) -> int:
+    # Same mapping the interpreter applies to an uncaught SystemExit
+    if exc.code is None:
+        return 0
+    return exc.code if isinstance(exc.code, int) else 1
+
+def _execute_in_child(payload, code_obj, reply_fd):
+    """
+    Runs in the forked child and never returns. Writes a frame with the captured
+    {"stdout": ..., "stderr": ...} to reply_fd, followed by the raw JSON reply.
+    """
+    exit_code = 1
+    try:
+        # Enforce the time budget from inside: SIGALRM's default action ends this child
+        # (even mid-numpy-call) and leaves the worker alive for the next execution
+        signal.setitimer(signal.ITIMER_REAL, payload["timeout_s"])
+
+        # fds 0-2 are the worker's protocol pipes; nothing the solver does may touch them
+        devnull = os.open(os.devnull, os.O_RDWR)
+        for fd in (0, 1, 2):
+            os.dup2(devnull, fd)
+        out_buf, err_buf = io.StringIO(), io.StringIO()
+        sys.stdout, sys.stderr = out_buf, err_buf
+
+        reply = b""
+        try:
+            reply = run_payload(payload, code_obj)
+            exit_code = 0
+        except SystemExit as e:
+            exit_code = _exit_code(e)
+        except BaseException:
+            traceback.print_exc()
+
+        logs = _json_dumps({"stdout": out_buf.getvalue(), "stderr": err_buf.getvalue()})
+        with os.fdopen(reply_fd, "wb") as f:
+            f.write(_FRAME_HEADER.pack(len(logs)) + logs + reply)
+    finally:
+        os._exit(exit_code)
+
+def serve():
+    stdin, stdout = sys.stdin.buffer, sys.stdout.buffer
+    while True:
+        request = _read_frame(stdin)
+        if request is None:
+            return # Parent closed the pipe
+        payload = json.loads(request)
+
+        # Compile before forking so the cache survives the child; compile errors are left
+        # for the child to raise, so they are reported like any other solver error
+        try:
+            code_obj = compile_solver(payload["code"])
+        except Exception:
+            code_obj = None
+
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            _execute_in_child(payload, code_obj, write_fd)
+        os.close(write_fd)
+
+        with os.fdopen(read_fd, "rb") as f:
+            data = f.read()
+        _, status = os.waitpid(pid, 0)
+
+        # No data means the child died before reporting (segfault, os._exit, ...)
+        if data:
+            (size,) = _FRAME_HEADER.unpack_from(data)
+            logs_end = _FRAME_HEADER.size + size
+            logs, reply = json.loads(data[_FRAME_HEADER.size:logs_end]), data[logs_end:]
+        else:
+            logs, reply = {"stdout": "", "stderr": ""}, b""
+        logs["exit_code"] = os.waitstatus_to_exitcode(status)
+
+        # Two frames: the logs/exit code, then the reply bytes forwarded as-is
+        _write_frame(stdout, _json_dumps(logs))
+        _write_frame(stdout, reply)
+
+if __name__ == "__main__":
+    serve()
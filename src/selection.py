@@ -5,24 +5,29 @@ def is_solved(candidates_object) -> bool:
     if not candidates_object:
         return False
 
-    total_model_runs = sum(group['count'] for group in candidates_object.values())
+    # Single pass: total runs, top count and how many groups deviate from count=1
+    total_model_runs = 0
+    max_count = 0
+    non_singleton_groups = 0
+    for group in candidates_object.values():
+        count = group['count']
+        total_model_runs += count
+        if count > max_count:
+            max_count = count
+        if count != 1:
+            non_singleton_groups += 1
+            if non_singleton_groups > 1:
+                # A second non-singleton group already fails condition 3
+                return False
+
     if total_model_runs == 0:
         return False
 
-    sorted_groups = sorted(candidates_object.values(), key=lambda g: g['count'], reverse=True)
-    top_group = sorted_groups[0]
-    max_count = top_group['count']
-    
-    percentage = (max_count / total_model_runs)
-    
-    # Condition 1: count > 25%
+    # Condition 1: count > 25% (compared in integers: max_count / total > 1/4)
     # Condition 2: count >= 11
-    if not (percentage > 0.25 and max_count >= 11):
+    if not (max_count * 4 > total_model_runs and max_count >= 11):
         return False
         
     # Condition 3: all other groups have exactly count=1
-    for group in sorted_groups[1:]:
-        if group['count'] != 1:
-            return False
-            
-    return True
\ No newline at end of file
+    # (the top group itself has count >= 11, so it is the only allowed non-singleton)
+    return non_singleton_groups == 1
\ No newline at end of file
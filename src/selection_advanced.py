@@ -1,13 +1,17 @@
+import heapq
 import sys
 from concurrent.futures import ThreadPoolExecutor
 from src.audit_prompts import build_logic_prompt, build_consistency_prompt, build_duo_pick_prompt
 from src.judges import run_judge, run_duo_pick_judge
+from src.selection_legacy import get_group_priority
+from src.types import Candidate
 
-def pick_solution_v2(candidates_object, reasoning_store, task, test_index, openai_client, anthropic_client, google_keys, judge_model="gpt-5.2-xhigh", verbose: int = 0, openai_background: bool = False, judge_consistency_enable: bool = False, judge_duo_pick_enable: bool = True, total_attempts: int = 0):
+def pick_solution_v2(candidates_object, reasoning_store, task, test_index, openai_client, anthropic_client, google_keys, judge_model="gpt-5.2-xhigh", verbose: int = 0, openai_background: bool = False, judge_consistency_enable: bool = False, judge_duo_pick_enable: bool = True, total_attempts: int = 0, judge_reasoning_max_chars: int = None):
     """
     Advanced solution picker using LLM Judges.
     - If judge_duo_pick_enable: Runs a "Council of 3 Duo Judges" to pick top solutions.
     - Fallback: Consensus (Vote Count) and Auditor Choice (Max Score).
+    - judge_reasoning_max_chars: optional cap on each reasoning trace in the Logic/Consistency prompts.
     """
     if verbose >= 1:
         print("\n[pick_solution_v2] Starting Advanced Solution Picker")
@@ -18,15 +22,17 @@ def pick_solution_v2(candidates_object, reasoning_store, task, test_index, opena
     
     # Flatten candidates for easy indexing
     candidates_list = []
+    # Keep each grid key and group reference so later steps never rebuild or re-hash them
     for idx, (grid_tuple, val) in enumerate(candidates_object.items()):
-        candidates_list.append({
-            "id": idx,
-            "grid": val.get("grid"),
-            "models": val.get("models"),
-            "count": val.get("count"),
-            "is_correct": val.get("is_correct"),
-            "reasoning": {} 
-        })
+        candidates_list.append(Candidate(
+            id=idx,
+            key=grid_tuple,
+            group=val,
+            grid=val.get("grid"),
+            models=val.get("models"),
+            count=val.get("count"),
+            is_correct=val.get("is_correct"),
+        ))
     
     if verbose >= 1:
         print(f"[pick_solution_v2] Total unique candidates found: {len(candidates_list)}")
@@ -41,13 +47,7 @@ def pick_solution_v2(candidates_object, reasoning_store, task, test_index, opena
         print("[pick_solution_v2] No candidates found.")
         return [], False, selection_metadata
 
-    # 1. Extract Reasoning
-    for cand in candidates_list:
-        for model_id in cand["models"]:
-            if model_id in reasoning_store:
-                cand["reasoning"][model_id] = reasoning_store[model_id]
-
-    # 2. Council of Duo Judges
+    # 1. Council of Duo Judges
     if judge_duo_pick_enable:
         duo_prompt = build_duo_pick_prompt(train_examples, test_input, candidates_list, reasoning_store, total_attempts)
         
@@ -77,6 +77,7 @@ def pick_solution_v2(candidates_object, reasoning_store, task, test_index, opena
 
         # Scoring System
         scoreboard = {} # grid_tuple -> {points, grid, origin, source_runs}
+        candidate_id_by_key = {cand.key: cand.id for cand in candidates_list}
 
         for run in council_results:
             grids = run.get("picked_grids")
@@ -90,12 +91,8 @@ def pick_solution_v2(candidates_object, reasoning_store, task, test_index, opena
                 
                 if res_tuple not in scoreboard:
                     # Check if it matches an existing candidate
-                    match_id = None
-                    for cand in candidates_list:
-                        if tuple(tuple(row) for row in cand['grid']) == res_tuple:
-                            match_id = cand['id']
-                            break
-                    
+                    match_id = candidate_id_by_key.get(res_tuple)
+
                     scoreboard[res_tuple] = {
                         "points": 0,
                         "grid": res_grid,
@@ -123,12 +120,14 @@ def pick_solution_v2(candidates_object, reasoning_store, task, test_index, opena
 
         # Select Top 2 from Judges
         final_selection_groups = []
+        chosen_keys = set()
         for i in range(min(2, len(sorted_scoreboard))):
-            grid_tuple, entry = sorted_scoreboard[i]
+            grid_key, entry = sorted_scoreboard[i]
+            chosen_keys.add(grid_key)
             
             if entry["matched_original_candidate_id"] is not None:
                 # Use existing candidate metadata
-                group = candidates_object[grid_tuple]
+                group = candidates_list[entry["matched_original_candidate_id"]].group
                 
                 feedback = f"\n\n--- COUNCIL OF JUDGES CHOICE (Score: {entry['points']}, Origin: {entry['origin']}) ---"
                 # Add a bit of reasoning from the first run that voted for it
@@ -155,22 +154,16 @@ def pick_solution_v2(candidates_object, reasoning_store, task, test_index, opena
             selection_metadata["selection_process"]["fallback_triggered"] = True
             
             # Sort candidates by consensus count
-            voted_candidates = sorted(candidates_list, key=lambda c: c['count'], reverse=True)
+            voted_candidates = sorted(candidates_list, key=lambda c: c.count, reverse=True)
             
             for cand in voted_candidates:
                 if len(final_selection_groups) >= 2:
                     break
                 
-                cand_tuple = tuple(tuple(row) for row in cand['grid'])
                 # Avoid duplicates
-                is_duplicate = False
-                for existing in final_selection_groups:
-                    if tuple(tuple(row) for row in existing['grid']) == cand_tuple:
-                        is_duplicate = True
-                        break
-                
-                if not is_duplicate:
-                    group = candidates_object[cand_tuple]
+                if cand.key not in chosen_keys:
+                    chosen_keys.add(cand.key)
+                    group = cand.group
                     group["reasoning_summary"] = group.get("reasoning_summary", "") + "\n\n--- FALLBACK SELECTION (Consensus) ---"
                     final_selection_groups.append(group)
 
@@ -181,47 +174,82 @@ def pick_solution_v2(candidates_object, reasoning_store, task, test_index, opena
         is_solved_flag = any(g.get("is_correct") for g in final_selection_groups)
         return final_selection_groups, is_solved_flag, selection_metadata
 
-    # 3. Standard Logic (Complete Fallback if Duo Pick Disabled)
+    # 2. Standard Logic (Complete Fallback if Duo Pick Disabled)
+    # Extract Reasoning (the duo prompt reads reasoning_store directly, so only this path needs it)
+    for cand in candidates_list:
+        cand.reasoning = {m: reasoning_store[m] for m in cand.models if m in reasoning_store}
+
     # Filter Candidates for Judging
-    multi_vote_candidates = [c for c in candidates_list if c['count'] >= 2]
+    multi_vote_candidates = [c for c in candidates_list if c.count >= 2]
     if len(multi_vote_candidates) >= 2:
         candidates_for_judging = multi_vote_candidates
     else:
         candidates_for_judging = candidates_list
 
-    # Build Prompts for Standard Judges
-    full_prompt_logic = build_logic_prompt(train_examples, test_input, candidates_for_judging)
-    full_prompt_cons = build_consistency_prompt(train_examples, test_input, candidates_for_judging)
+    # Strong consensus: the solver's own is_solved rule holds, or every other grid is a singleton
+    # and the top grid holds a majority of at least 4 votes. The judges would not change
+    # Attempt 1, so skip both calls.
+    from src.selection import is_solved # src.selection imports this module
+    total_votes = sum(c.count for c in candidates_list)
+    top_count = max(c.count for c in candidates_list)
+    strong_consensus = is_solved(candidates_object) or (
+        sum(1 for c in candidates_list if c.count != 1) == 1
+        and top_count >= 4
+        and top_count * 2 > total_votes
+    )
+
+    scores = {c.id: 0.0 for c in candidates_list}
+    logic_data = None
+    cons_data = None
+    logic_res = None
+    cons_res = None
 
-    # Run Standard Judges
-    scores = {c['id']: 0.0 for c in candidates_list}
-    logic_data = { "prompt": full_prompt_logic, "response": None, "parsed": None }
-    cons_data = { "prompt": full_prompt_cons, "response": None, "parsed": None }
+    if strong_consensus:
+        if verbose >= 1:
+            print(f"[pick_solution_v2] Strong consensus ({top_count}/{total_votes} votes). Skipping judges.")
+    else:
+        # Build Prompts for Standard Judges
+        full_prompt_logic = build_logic_prompt(train_examples, test_input, candidates_for_judging, judge_reasoning_max_chars)
+        full_prompt_cons = build_consistency_prompt(train_examples, test_input, candidates_for_judging, judge_reasoning_max_chars)
+
+        # Run Standard Judges
+        logic_data = { "prompt": full_prompt_logic, "response": None, "parsed": None }
+        cons_data = { "prompt": full_prompt_cons, "response": None, "parsed": None }
 
-    with ThreadPoolExecutor(max_workers=20) as executor:
-        future_logic = executor.submit(run_judge, "Logic", full_prompt_logic, judge_model, openai_client, anthropic_client, google_keys, logic_data, verbose, openai_background)
-        future_cons = None
+        # The provider SDK clients are blocking, so overlap the two judges with threads:
+        # Consistency runs on a worker while Logic runs on the calling thread.
         if judge_consistency_enable:
-            future_cons = executor.submit(run_judge, "Consistency", full_prompt_cons, judge_model, openai_client, anthropic_client, google_keys, cons_data, verbose, openai_background)
-        logic_res = future_logic.result()
-        cons_res = future_cons.result() if future_cons else None
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                future_cons = executor.submit(run_judge, "Consistency", full_prompt_cons, judge_model, openai_client, anthropic_client, google_keys, cons_data, verbose, openai_background)
+                logic_res = run_judge("Logic", full_prompt_logic, judge_model, openai_client, anthropic_client, google_keys, logic_data, verbose, openai_background)
+                cons_res = future_cons.result()
+        else:
+            logic_res = run_judge("Logic", full_prompt_logic, judge_model, openai_client, anthropic_client, google_keys, logic_data, verbose, openai_background)
 
     # Update Scores
-    if logic_res and "candidates" in logic_res:
-        for c in logic_res["candidates"]:
-            cid = c.get("candidate_id")
-            if cid in scores: scores[cid] = max(scores[cid], c.get("score", 0))
-    if cons_res and "candidates" in cons_res:
-        for c in cons_res["candidates"]:
-            cid = c.get("candidate_id")
-            if cid in scores: scores[cid] = max(scores[cid], c.get("score", 0))
+    for judge_res in (logic_res, cons_res):
+        if judge_res and "candidates" in judge_res:
+            for c in judge_res["candidates"]:
+                cid = c.get("candidate_id")
+                if cid in scores:
+                    score = c.get("score", 0)
+                    if score > scores[cid]: scores[cid] = score
 
     # Determine Attempts
-    candidates_by_consensus = sorted(candidates_list, key=lambda c: (c['count'], scores[c['id']]), reverse=True)
-    attempt_1_candidate = candidates_by_consensus[0]
+    # Only the leaders are needed, so pick them with max / nlargest instead of full sorts
+    # (both keep the first of equal-key candidates, like the stable sorts they replace)
+    attempt_1_candidate = max(candidates_list, key=lambda c: (c.count, scores[c.id]))
     
-    sorted_by_score = sorted(candidates_list, key=lambda c: scores[c['id']], reverse=True)
-    attempt_2_candidate = next((c for c in sorted_by_score if c['id'] != attempt_1_candidate['id']), None)
+    if strong_consensus:
+        # No judge scores to rank the rest, so take the runner-up by votes, then by the models behind it
+        attempt_2_candidate = max(
+            (c for c in candidates_list if c.id != attempt_1_candidate.id),
+            key=lambda c: (c.count, get_group_priority(c.group)),
+            default=None,
+        )
+    else:
+        top_by_score = heapq.nlargest(2, candidates_list, key=lambda c: scores[c.id])
+        attempt_2_candidate = next((c for c in top_by_score if c.id != attempt_1_candidate.id), None)
             
     final_selection = [attempt_1_candidate]
     if attempt_2_candidate: final_selection.append(attempt_2_candidate)
@@ -231,9 +259,11 @@ def pick_solution_v2(candidates_object, reasoning_store, task, test_index, opena
     selection_metadata["judges"]["consistency"] = cons_data
     selection_metadata["selection_process"] = {
         "type": "Standard (Consensus/Auditor)",
-        "attempt_1": {"candidate_id": attempt_1_candidate['id'], "votes": attempt_1_candidate['count']},
-        "attempt_2": {"candidate_id": attempt_2_candidate['id'] if attempt_2_candidate else None}
+        "attempt_1": {"candidate_id": attempt_1_candidate.id, "votes": attempt_1_candidate.count},
+        "attempt_2": {"candidate_id": attempt_2_candidate.id if attempt_2_candidate else None}
     }
+    if strong_consensus:
+        selection_metadata["selection_process"]["shortcut"] = "strong_consensus"
 
     # Prepare Judge Feedback Map
     judge_feedback_map = {}
@@ -249,15 +279,14 @@ def pick_solution_v2(candidates_object, reasoning_store, task, test_index, opena
     # Construct Return Output
     top_groups = []
     for cand in final_selection:
-        grid_tuple = tuple(tuple(row) for row in cand['grid'])
-        group = candidates_object[grid_tuple]
+        group = cand.group
         
         final_summary_parts = []
-        if cand['id'] in judge_feedback_map:
-            final_summary_parts.append(judge_feedback_map[cand['id']])
-        if cand["reasoning"]:
-            first_model_id = next(iter(cand["reasoning"]))
-            raw_reasoning = cand["reasoning"][first_model_id]
+        if cand.id in judge_feedback_map:
+            final_summary_parts.append(judge_feedback_map[cand.id])
+        if cand.reasoning:
+            first_model_id = next(iter(cand.reasoning))
+            raw_reasoning = cand.reasoning[first_model_id]
             final_summary_parts.append("\n\n--- EXAMPLE REASONING ---" + raw_reasoning)
         
         group["reasoning_summary"] = "".join(final_summary_parts).strip()
@@ -1,34 +1,47 @@
-def pick_solution(candidates_object, verbose: int = 0):
-    # Model priority mapping (higher number = higher priority)
-    MODEL_PRIORITY = {
-        "claude-opus-4.5-thinking-60000": 4,
-        "gemini-3-high": 3,
-        "gpt-5.1-medium": 2,
-        "claude-sonnet-4.5-thinking-60000": 1
-    }
+import functools
+import heapq
+import re
+import sys
 
-    def get_group_priority(group):
-        max_priority = 0
-        for run_id in group['models']:
-            # run_id format is typically "model-name_count_step"
-            # We try to match the longest possible prefix in our priority map
-            for model_name, priority in MODEL_PRIORITY.items():
-                if run_id.startswith(model_name):
-                    if priority > max_priority:
-                        max_priority = priority
-        return max_priority
+# Model priority mapping (higher number = higher priority)
+MODEL_PRIORITY = {
+    "claude-opus-4.5-thinking-60000": 4,
+    "gemini-3-high": 3,
+    "gpt-5.1-medium": 2,
+    "claude-sonnet-4.5-thinking-60000": 1
+}
 
-    # Sort by count (descending) and then by priority (descending)
-    sorted_groups = sorted(
-        candidates_object.values(), 
-        key=lambda g: (g['count'], get_group_priority(g)), 
-        reverse=True
-    )
-    
+# One anchored alternation, longest prefix first, so the first alternative that matches is
+# the most specific model name; the group index maps back to its priority
+_PRIORITY_PREFIXES = sorted(MODEL_PRIORITY.items(), key=lambda kv: len(kv[0]), reverse=True)
+_PRIORITY_RE = re.compile("|".join(f"({re.escape(name)})" for name, _ in _PRIORITY_PREFIXES))
+_PRIORITY_BY_GROUP = [priority for _, priority in _PRIORITY_PREFIXES]
+_TOP_PRIORITY = max(MODEL_PRIORITY.values())
+
+@functools.lru_cache(maxsize=4096)
+def _run_id_priority(run_id: str) -> int:
+    # run_id format is typically "model-name_count_step"
+    match = _PRIORITY_RE.match(run_id)
+    return _PRIORITY_BY_GROUP[match.lastindex - 1] if match else 0
+
+def get_group_priority(group) -> int:
+    max_priority = 0
+    for run_id in group['models']:
+        priority = _run_id_priority(run_id)
+        if priority > max_priority:
+            if priority == _TOP_PRIORITY:
+                return priority # no other run can rank the group higher
+            max_priority = priority
+    return max_priority
+
+def pick_solution(candidates_object, verbose: int = 0):
+    # Rank by count (descending) and then by priority (descending).
+    # Only the top 2 are submitted; the full ranking is needed only for the verbose report.
+    rank_key = lambda g: (g['count'], get_group_priority(g))
     if verbose >= 1:
-        print("\n" + "="*40)
-        print("FINAL OUTCOME")
-        print("="*40)
+        sorted_groups = sorted(candidates_object.values(), key=rank_key, reverse=True)
+    else:
+        sorted_groups = heapq.nlargest(2, candidates_object.values(), key=rank_key)
     
     is_solved_flag = False
     unknown_status = False
@@ -41,41 +54,43 @@ def pick_solution(candidates_object, verbose: int = 0):
             is_solved_flag = True
         elif len(top_groups) > 1 and top_groups[1]["is_correct"]:
             is_solved_flag = True
-        
-    if unknown_status:
-        if verbose >= 1:
-            print("Outcome: SUBMITTED (No Ground Truth)")
-    elif is_solved_flag:
-        if verbose >= 1:
-            print("Outcome: SOLVED")
-    else:
-        if verbose >= 1:
-            print("Outcome: FAILED")
 
     if verbose >= 1:
-        print("\n--- Debug Info ---")
+        # Buffer the report and emit it with a single write
+        lines = ["", "="*40, "FINAL OUTCOME", "="*40]
+
+        if unknown_status:
+            lines.append("Outcome: SUBMITTED (No Ground Truth)")
+        elif is_solved_flag:
+            lines.append("Outcome: SOLVED")
+        else:
+            lines.append("Outcome: FAILED")
+
+        lines.append("\n--- Debug Info ---")
         if not top_groups:
-            print("No solutions generated.")
+            lines.append("No solutions generated.")
         else:
             for i, group in enumerate(top_groups):
                 correctness = group.get('is_correct')
                 c_str = "Unknown" if correctness is None else str(correctness)
                 priority = get_group_priority(group)
-                print(f"Group {i+1}: Count={group['count']}, Priority={priority}, Correct={c_str}")
-                print(f"  Models: {', '.join(group['models'])}")
+                lines.append(f"Group {i+1}: Count={group['count']}, Priority={priority}, Correct={c_str}")
+                lines.append(f"  Models: {', '.join(group['models'])}")
 
-    # Check for other correct groups
-    other_correct = []
-    for i, group in enumerate(sorted_groups):
-        if i < 2:
-            continue
-        if group.get('is_correct') is True:
-            other_correct.append((i + 1, group))
-            
-    if other_correct and verbose >= 1:
-        print("\n--- Other Correct Groups ---")
-        for rank, group in other_correct:
-            print(f"Group {rank}: Count={group['count']}, Correct={group['is_correct']}")
-            print(f"  Models: {', '.join(group['models'])}")
+        # Check for other correct groups
+        other_correct = []
+        for i, group in enumerate(sorted_groups):
+            if i < 2:
+                continue
+            if group.get('is_correct') is True:
+                other_correct.append((i + 1, group))
+
+        if other_correct:
+            lines.append("\n--- Other Correct Groups ---")
+            for rank, group in other_correct:
+                lines.append(f"Group {rank}: Count={group['count']}, Correct={group['is_correct']}")
+                lines.append(f"  Models: {', '.join(group['models'])}")
+
+        sys.stdout.write("\n".join(lines) + "\n")
             
     return top_groups, is_solved_flag, {}
\ No newline at end of file
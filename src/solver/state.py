@@ -12,7 +12,7 @@ from src.logging import setup_logging, write_step_log, PrefixedStdout
 from src.models import parse_model_arg, PRICING_PER_1M_TOKENS, GEMINI_3_BASE
 
 class SolverState:
-    def __init__(self, task_id: str, test_index: int, verbose: int, is_testing: bool, run_timestamp: str, task_path: Path = None, answer_path: Path = None, judge_model: str = "gpt-5.2-xhigh", old_pick_solution: bool = False, task_status=None, openai_background: bool = True, judge_consistency_enable: bool = False, judge_duo_pick_enable: bool = True, codegen_prompt: str = "v1b", logs_directory: str = "logs/", task_data: dict = None):
+    def __init__(self, task_id: str, test_index: int, verbose: int, is_testing: bool, run_timestamp: str, task_path: Path = None, answer_path: Path = None, judge_model: str = "gpt-5.2-xhigh", old_pick_solution: bool = False, task_status=None, openai_background: bool = True, judge_consistency_enable: bool = False, judge_duo_pick_enable: bool = True, judge_reasoning_max_chars: int = None, codegen_prompt: str = "v1b", logs_directory: str = "logs/", task_data: dict = None):
         self.task_id = task_id
         self.test_index = test_index
         self.verbose = verbose
@@ -25,6 +25,7 @@ class SolverState:
         self.openai_background = openai_background
         self.judge_consistency_enable = judge_consistency_enable
         self.judge_duo_pick_enable = judge_duo_pick_enable
+        self.judge_reasoning_max_chars = judge_reasoning_max_chars
         self.codegen_prompt = codegen_prompt
         self.logs_directory = logs_directory
         self.task_status.setdefault('step', '0')
@@ -194,6 +195,7 @@ class SolverState:
                             openai_background=self.openai_background,
                             judge_consistency_enable=self.judge_consistency_enable,
                             judge_duo_pick_enable=self.judge_duo_pick_enable,
+                            judge_reasoning_max_chars=self.judge_reasoning_max_chars,
                             total_attempts=total_attempts
                         )        
         if not has_ground_truth:
@@ -75,7 +75,19 @@ ORDERED_MODELS = [
 ]
 SUPPORTED_MODELS: Set[str] = set(ORDERED_MODELS)
 
-@dataclass
+@dataclass(slots=True)
+class Candidate:
+    """One unique answer grid as seen by the solution pickers and judge prompts."""
+    id: int
+    key: tuple  # the grid's key in candidates_object
+    group: dict  # the candidates_object entry itself
+    grid: Grid
+    models: List[str]
+    count: int
+    is_correct: Optional[bool] = None
+    reasoning: Optional[dict] = None  # model run id -> reasoning, filled for the standard judges
+
+@dataclass(slots=True)
 class TaskResult:
     task_path: Path
     test_index: int
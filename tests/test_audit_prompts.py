@@ -0,0 +1,32 @@
+import sys
+from pathlib import Path
+
+# Add project root to sys.path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.audit_prompts import _trim_reasoning
+
+
+def test_trim_reasoning_is_off_by_default():
+    text = "a\n\n\n\n\nb" * 5000
+    assert _trim_reasoning(text) == text
+
+
+def test_trim_reasoning_keeps_short_text():
+    assert _trim_reasoning("step 1\nstep 2", max_chars=100) == "step 1\nstep 2"
+
+
+def test_trim_reasoning_collapses_blank_runs():
+    assert _trim_reasoning("a\n\n\n\n\nb", max_chars=100) == "a\n\nb"
+
+
+def test_trim_reasoning_keeps_head_and_tail():
+    text = "H" * 50 + "M" * 1000 + "T" * 50
+    trimmed = _trim_reasoning(text, max_chars=100)
+    assert trimmed == "H" * 50 + "\n...[truncated]...\n" + "T" * 50
+
+
+
+def test_trim_reasoning_tiny_limits_keep_head_only():
+    assert _trim_reasoning("abcdefghij", max_chars=1) == "a\n...[truncated]..."
+    assert _trim_reasoning("abcdefghij", max_chars=0) == "\n...[truncated]..."
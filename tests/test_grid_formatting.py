@@ -0,0 +1,52 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to sys.path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.grid import grid_to_string, grid_to_csv_rows
+
+
+def reference_grid_to_string(grid):
+    lines = [f"Size: {len(grid)}x{len(grid[0])}"]
+    lines.extend("".join(str(c) for c in row) for row in grid)
+    return "\n".join(lines)
+
+
+def reference_grid_to_csv_rows(grid, padding="      "):
+    return "\n".join(padding + ",".join(map(str, row)) for row in grid)
+
+
+GRIDS = [
+    [[0]],
+    [[1, 2, 3]],
+    [[1], [2], [3]],
+    [[0, 1, 2], [3, 4, 5], [6, 7, 8], [9, 9, 9]],
+    # Fallback paths: multi-digit values and ragged rows (possible in parsed LLM output)
+    [[10, 1], [2, 3]],
+    [[1, 2, 3], [4, 5]],
+    # Large enough for the vectorized formatters, and large grids that must still fall back
+    [[(r * c) % 10 for c in range(12)] for r in range(12)],
+    [[10] + [0] * 9] + [[0] * 10 for _ in range(9)],
+    [[0] * 10 for _ in range(9)] + [[1, 2]],
+]
+
+
+@pytest.mark.parametrize("grid", GRIDS)
+def test_grid_to_string_matches_reference(grid):
+    assert grid_to_string(grid) == reference_grid_to_string(grid)
+
+
+@pytest.mark.parametrize("grid", GRIDS)
+@pytest.mark.parametrize("padding", ["      ", ""])
+def test_grid_to_csv_rows_matches_reference(grid, padding):
+    assert grid_to_csv_rows(grid, padding) == reference_grid_to_csv_rows(grid, padding)
+
+
+def test_empty_grids():
+    assert grid_to_string(None) == "(Empty Grid)"
+    assert grid_to_string([]) == "(Empty Grid)"
+    assert grid_to_csv_rows(None) == ""
+    assert grid_to_csv_rows([]) == ""
@@ -0,0 +1,65 @@
+import sys
+import json
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add project root to sys.path
+sys.path.append(str(Path(__file__).parent.parent))
+
+import src.judges as judges
+from src.judges import run_judge, run_duo_pick_judge
+
+VERDICT = {"candidates": [{"candidate_id": 0, "score": 8}]}
+
+
+def fake_call_model(calls):
+    def call_model(*args, **kwargs):
+        calls.append(args[3])
+        return SimpleNamespace(text=json.dumps(VERDICT), prompt_tokens=10, completion_tokens=5, cached_tokens=0)
+    return call_model
+
+
+def test_run_judge_reuses_cached_verdict(monkeypatch, tmp_path):
+    calls = []
+    monkeypatch.setattr(judges, "call_model", fake_call_model(calls))
+    monkeypatch.setenv("ARC_AGI_JUDGE_CACHE_DIR", str(tmp_path))
+
+    first, second = {}, {}
+    assert run_judge("Logic", "prompt", "judge-model", None, None, None, first) == VERDICT
+    assert run_judge("Logic", "prompt", "judge-model", None, None, None, second) == VERDICT
+
+    assert calls == ["prompt"]
+    assert "cache_hit" not in first
+    assert second["cache_hit"] is True
+    assert second["response"] == first["response"]
+    assert len(list((tmp_path / "judge-model").glob("*.json"))) == 1
+
+
+def test_run_judge_without_cache_dir_always_calls(monkeypatch):
+    calls = []
+    monkeypatch.setattr(judges, "call_model", fake_call_model(calls))
+    monkeypatch.delenv("ARC_AGI_JUDGE_CACHE_DIR", raising=False)
+
+    run_judge("Logic", "prompt", "judge-model", None, None, None, {})
+    run_judge("Logic", "prompt", "judge-model", None, None, None, {})
+
+    assert calls == ["prompt", "prompt"]
+
+
+def test_duo_pick_runs_are_cached_separately(monkeypatch, tmp_path):
+    calls = []
+
+    def call_model(*args, **kwargs):
+        calls.append(args[3])
+        return SimpleNamespace(text=f"```\n{len(calls)},0\n```\n```\n9,9\n```", prompt_tokens=10, completion_tokens=5)
+    monkeypatch.setattr(judges, "call_model", call_model)
+    monkeypatch.setenv("ARC_AGI_JUDGE_CACHE_DIR", str(tmp_path))
+
+    first_runs = [{"run_index": i} for i in range(2)]
+    picks = [run_duo_pick_judge("prompt", "judge-model", None, None, None, run) for run in first_runs]
+    assert picks == [[[[1, 0]], [[9, 9]]], [[[2, 0]], [[9, 9]]]]
+
+    rerun = {"run_index": 1}
+    assert run_duo_pick_judge("prompt", "judge-model", None, None, None, rerun) == picks[1]
+    assert rerun["cache_hit"] is True
+    assert len(calls) == 2
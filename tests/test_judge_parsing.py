@@ -0,0 +1,36 @@
+import sys
+import json
+from pathlib import Path
+
+# Add project root to sys.path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.judges import extract_json
+
+VERDICT = {"candidates": [{"candidate_id": 0, "score": 7, "rule_summary": "Fill {holes} with \"blue\""}]}
+VERDICT_JSON = json.dumps(VERDICT, indent=2)
+
+
+def test_extract_json_plain_object():
+    assert extract_json(VERDICT_JSON) == VERDICT
+
+
+def test_extract_json_prefers_fenced_block():
+    text = f"<AUDIT_LOG>checking {{braces}}</AUDIT_LOG>\n```json\n{VERDICT_JSON}\n```\nDone."
+    assert extract_json(text) == VERDICT
+
+
+def test_extract_json_skips_objects_without_candidates():
+    text = f'```json\n{{"note": 1}}\n```\nFinal: {VERDICT_JSON}'
+    assert extract_json(text) == VERDICT
+
+
+def test_extract_json_finds_nested_object():
+    text = json.dumps({"result": VERDICT})
+    assert extract_json(text) == VERDICT
+
+
+def test_extract_json_no_match():
+    assert extract_json(None) is None
+    assert extract_json("no json here") is None
+    assert extract_json('{"candidates": [1, 2') is None
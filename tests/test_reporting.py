@@ -0,0 +1,69 @@
+import sys
+import json
+from pathlib import Path
+
+# Add project root to sys.path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.reporting import TABLE_COLUMNS, print_result_row, save_json_log
+from src.types import TaskResult
+
+
+def make_result(**overrides):
+    fields = dict(
+        task_path=Path("evaluation/abcd1234.json"),
+        test_index=1,
+        success=True,
+        model_arg="gpt-5.2-low",
+        duration=1.234,
+        cost=0.5,
+        strategy=None,
+        verified=None,
+    )
+    fields.update(overrides)
+    return TaskResult(**fields)
+
+
+def printed_cells(capsys, row_idx, result):
+    print_result_row(row_idx, result)
+    row = capsys.readouterr().out.strip()
+    return [c.strip() for c in row.strip("|").split("|")]
+
+
+def test_print_result_row_fills_single_model_column(capsys):
+    cells = printed_cells(capsys, 3, make_result())
+
+    assert cells[:3] == ["3", "evaluation/abcd1234.json", "1"]
+    model_cells = cells[3:3 + len(TABLE_COLUMNS)]
+    assert model_cells[TABLE_COLUMNS.index("GPT-5.2-Low")] == "PASS"
+    assert model_cells.count("-") == len(TABLE_COLUMNS) - 1
+    assert cells[-3:] == ["1.23", "0.50", "-"]
+
+
+def test_print_result_row_verified_and_failure(capsys):
+    cells = printed_cells(capsys, 1, make_result(success=False, verified=True, model_arg="gemini-3-high"))
+
+    assert cells[3 + TABLE_COLUMNS.index("Gemini-3-High")] == "FAIL"
+    assert cells[-1] == "PASS"
+
+
+def test_save_json_log_writes_valid_array(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    results = [make_result(strategy="line 1\nline 2", verified=True), make_result(test_index=2, success=False)]
+    save_json_log(results, "gpt-5.2-low", "evaluation")
+
+    log_files = list((tmp_path / "logs").glob("*.json"))
+    assert len(log_files) == 1
+    data = json.loads(log_files[0].read_text())
+    assert [entry["test_index"] for entry in data] == [1, 2]
+    assert data[0]["strategy"] == "line 1\nline 2"
+    assert data[0]["verified"] == "PASS"
+    assert "verified" not in data[1]
+
+
+def test_save_json_log_empty(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    save_json_log([], "gpt-5.2-low", "evaluation")
+
+    log_file = next((tmp_path / "logs").glob("*.json"))
+    assert json.loads(log_file.read_text()) == []
@@ -0,0 +1,121 @@
+import sys
+from pathlib import Path
+
+# Add project root to sys.path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.sandbox import run_untrusted_code
+
+
+def test_runs_solver_on_numpy_input():
+    ok, output, _ = run_untrusted_code("def solver(g):\n    return (g + 1).tolist()\n", [[1, 2], [3, 4]])
+    assert ok
+    assert output == [[2, 3], [4, 5]]
+
+
+def test_solver_exception_is_reported():
+    ok, error, logs = run_untrusted_code("def solver(g):\n    raise ValueError('bad')\n", [[1]])
+    assert not ok
+    assert error == "ValueError: bad"
+    assert "Traceback" in logs
+
+
+def test_printing_solver_output_is_rejected():
+    ok, error, _ = run_untrusted_code("def solver(g):\n    print('hi')\n    return [[1]]\n", [[1]])
+    assert not ok
+    assert error == "Invalid JSON output from subprocess"
+
+
+def test_sys_exit_is_reported_as_crash():
+    ok, error, _ = run_untrusted_code("import sys\ndef solver(g):\n    sys.exit(3)\n", [[1]])
+    assert not ok
+    assert error == "Subprocess crashed (Exit Code: 3)"
+
+
+def test_solvers_do_not_share_state():
+    mutate = "import numpy\ndef solver(g):\n    numpy.array = None\n    return [[1]]\n"
+    assert run_untrusted_code(mutate, [[1]])[0]
+    ok, output, _ = run_untrusted_code("def solver(g):\n    return (g * 2).tolist()\n", [[3]])
+    assert ok
+    assert output == [[6]]
+
+
+def test_timeout_kills_execution():
+    ok, error, _ = run_untrusted_code("import time\ndef solver(g):\n    time.sleep(5)\n", [[1]], timeout_s=0.5)
+    assert not ok
+    assert error == "TIMEOUT_EXPIRED"
+    # The pool recovers with a fresh worker
+    assert run_untrusted_code("def solver(g):\n    return [[0]]\n", [[1]]) == (True, [[0]], "")
+
+
+def test_outputs_outside_orjson_range_round_trip():
+    import math
+
+    ok, output, _ = run_untrusted_code("def solver(g):\n    return [[2 ** 70, float('nan')]]\n", [[1]])
+    assert ok
+    assert output[0][0] == 2 ** 70
+    assert math.isnan(output[0][1])
+
+
+def test_pool_caps_workers_and_reaps_idle_ones():
+    import threading
+    import time
+    from src.sandbox import SandboxPool
+
+    pool = SandboxPool(max_workers=2, idle_timeout_s=0.4)
+    payload = {"code": "import time\ndef solver(g):\n    time.sleep(0.2)\n    return g\n", "input": [[1]], "timeout_s": 5}
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(pool.run(payload, 5))) for _ in range(5)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert results == [(True, [[1]], "")] * 5
+    assert len(pool._workers) == 2
+
+    time.sleep(1.0)
+    assert not pool._workers and not pool._idle
+
+
+def test_dead_idle_worker_is_replaced():
+    import os
+    import signal
+    from src.sandbox import SandboxPool
+
+    pool = SandboxPool(max_workers=1)
+    payload = {"code": "def solver(g):\n    return g\n", "input": [[1]], "timeout_s": 5}
+    assert pool.run(payload, 5) == (True, [[1]], "")
+
+    dead = pool._idle[-1][0]
+    os.kill(dead.proc.pid, signal.SIGKILL)
+    dead.proc.wait()
+    assert pool.run(payload, 5) == (True, [[1]], "")
+    assert dead not in pool._workers
+    pool.reap_idle()
+
+
+def test_worker_lost_mid_request_is_retried(monkeypatch):
+    import os
+    import signal
+    from src.sandbox import SandboxPool, SandboxWorker
+
+    pool = SandboxPool(max_workers=2)
+    payload = {"code": "def solver(g):\n    return g\n", "input": [[2]], "timeout_s": 5}
+    assert pool.run(payload, 5) == (True, [[2]], "")
+
+    # Kill the worker after checkout, so the request itself hits the dead pipe
+    real_execute = SandboxWorker.execute
+    killed = []
+
+    def execute(self, *args):
+        if not killed:
+            killed.append(self)
+            os.kill(self.proc.pid, signal.SIGKILL)
+            self.proc.wait()
+        return real_execute(self, *args)
+    monkeypatch.setattr(SandboxWorker, "execute", execute)
+
+    assert pool.run(payload, 5) == (True, [[2]], "")
+    assert killed and killed[0] not in pool._workers
+    pool.reap_idle()
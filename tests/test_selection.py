@@ -0,0 +1,158 @@
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add project root to sys.path
+sys.path.append(str(Path(__file__).parent.parent))
+
+import src.selection_advanced as selection_advanced
+from src.selection_advanced import pick_solution_v2
+
+
+def make_task():
+    example = SimpleNamespace(input=[[0]], output=[[1]])
+    return SimpleNamespace(train=[example], test=[SimpleNamespace(input=[[0]], output=None)])
+
+
+def make_candidates(counts):
+    candidates_object = {}
+    for i, count in enumerate(counts):
+        grid = [[i]]
+        candidates_object[((i,),)] = {
+            "grid": grid,
+            "count": count,
+            "models": [f"model_{i}_{j}" for j in range(count)],
+            "is_correct": i == 0,
+        }
+    return candidates_object
+
+
+def test_standard_judges_skipped_on_strong_consensus(monkeypatch):
+    def fail_judge(*args, **kwargs):
+        raise AssertionError("judge should not be called")
+    monkeypatch.setattr(selection_advanced, "run_judge", fail_judge)
+
+    candidates_object = make_candidates([5, 1, 1])
+    top_groups, solved, metadata = pick_solution_v2(
+        candidates_object, {}, make_task(), 1, None, None, None,
+        judge_duo_pick_enable=False,
+    )
+
+    assert solved
+    assert [g["grid"] for g in top_groups] == [[[0]], [[1]]]
+    assert metadata["selection_process"]["shortcut"] == "strong_consensus"
+
+
+
+def test_strong_consensus_attempt_2_prefers_higher_priority_models(monkeypatch):
+    def fail_judge(*args, **kwargs):
+        raise AssertionError("judge should not be called")
+    monkeypatch.setattr(selection_advanced, "run_judge", fail_judge)
+
+    candidates_object = make_candidates([5, 1, 1])
+    candidates_object[((2,),)]["models"] = ["claude-opus-4.5-thinking-60000_1_step_1"]
+    top_groups, _, _ = pick_solution_v2(
+        candidates_object, {}, make_task(), 1, None, None, None,
+        judge_duo_pick_enable=False,
+    )
+
+    assert [g["grid"] for g in top_groups] == [[[0]], [[2]]]
+
+def test_standard_judges_run_without_strong_consensus(monkeypatch):
+    calls = []
+    def fake_judge(judge_name, *args, **kwargs):
+        calls.append(judge_name)
+        return {"candidates": [{"candidate_id": 1, "score": 9}]}
+    monkeypatch.setattr(selection_advanced, "run_judge", fake_judge)
+
+    candidates_object = make_candidates([3, 2, 1])
+    top_groups, _, metadata = pick_solution_v2(
+        candidates_object, {}, make_task(), 1, None, None, None,
+        judge_duo_pick_enable=False,
+    )
+
+    assert calls == ["Logic"]
+    assert [g["grid"] for g in top_groups] == [[[0]], [[1]]]
+    assert "shortcut" not in metadata["selection_process"]
+
+
+def test_duo_council_returns_original_groups(monkeypatch):
+    def fake_duo_judge(prompt, judge_model, openai_client, anthropic_client, google_keys, result_container, *args):
+        result_container["response"] = "picked"
+        result_container["picked_grids"] = [[[1]], [[7]]]
+        return result_container["picked_grids"]
+    monkeypatch.setattr(selection_advanced, "run_duo_pick_judge", fake_duo_judge)
+
+    candidates_object = make_candidates([3, 2, 1])
+    top_groups, solved, metadata = pick_solution_v2(
+        candidates_object, {}, make_task(), 1, None, None, None,
+        total_attempts=6,
+    )
+
+    assert not solved
+    assert top_groups[0] is candidates_object[((1,),)]
+    assert top_groups[1]["grid"] == [[7]]
+    assert top_groups[1]["models"] == ["duo_pick_council_synth_1"]
+    scoreboard = metadata["selection_process"]["scoreboard"]
+    assert [(e["points"], e["matched_original_candidate_id"]) for e in scoreboard] == [(6, 1), (3, None)]
+
+
+def test_duo_council_fallback_skips_chosen_grid(monkeypatch):
+    def fake_duo_judge(prompt, judge_model, openai_client, anthropic_client, google_keys, result_container, *args):
+        result_container["response"] = "picked"
+        result_container["picked_grids"] = [[[0]]]
+        return result_container["picked_grids"]
+    monkeypatch.setattr(selection_advanced, "run_duo_pick_judge", fake_duo_judge)
+
+    candidates_object = make_candidates([3, 2, 1])
+    top_groups, solved, metadata = pick_solution_v2(
+        candidates_object, {}, make_task(), 1, None, None, None,
+        total_attempts=6,
+    )
+
+    assert solved
+    assert top_groups == [candidates_object[((0,),)], candidates_object[((1,),)]]
+    assert metadata["selection_process"]["fallback_triggered"]
+
+
+def test_get_group_priority_uses_highest_model_prefix():
+    from src.selection_legacy import get_group_priority
+
+    assert get_group_priority({"models": ["gpt-5.2-xhigh_1_step_1"]}) == 0
+    assert get_group_priority({"models": ["gpt-5.1-medium_1_step_1", "gemini-3-high_2_step_1"]}) == 3
+    assert get_group_priority({"models": ["claude-opus-4.5-thinking-60000_1_step_5", "gemini-3-high_1_step_1"]}) == 4
+
+
+def test_is_solved_thresholds():
+    from src.selection import is_solved
+
+    def groups(*counts):
+        return {i: {"count": c} for i, c in enumerate(counts)}
+
+    assert not is_solved({})
+    assert is_solved(groups(11, 1, 1))
+    assert not is_solved(groups(10, 1))                # fewer than 11 votes
+    assert not is_solved(groups(11, *([1] * 33)))      # exactly 25% share
+    assert is_solved(groups(11, *([1] * 32)))          # just over 25% share
+    assert not is_solved(groups(11, 2, 1))             # a second non-singleton group
+
+
+def test_standard_judges_skipped_when_is_solved(monkeypatch):
+    from src.selection import is_solved
+
+    def fail_judge(*args, **kwargs):
+        raise AssertionError("judge should not be called")
+    monkeypatch.setattr(selection_advanced, "run_judge", fail_judge)
+
+    # 11 of 31 votes: below a majority, but the solver already treats this as solved
+    candidates_object = make_candidates([11] + [1] * 20)
+    assert is_solved(candidates_object)
+
+    top_groups, solved, metadata = pick_solution_v2(
+        candidates_object, {}, make_task(), 1, None, None, None,
+        judge_duo_pick_enable=False,
+    )
+
+    assert solved
+    assert top_groups[0] is candidates_object[((0,),)]
+    assert metadata["selection_process"]["shortcut"] == "strong_consensus"